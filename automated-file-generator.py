@@ -4,64 +4,97 @@ import subprocess
 import shutil
 import platform
 import time
-import glob 
+import fnmatch
+import string
 import xml.etree.ElementTree as ET
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Tuple, List, Optional
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QLineEdit, QSpinBox, 
                              QTabWidget, QMessageBox, QTextEdit, QFileDialog, QSplitter)
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QThread, pyqtSignal, Qt, QMutex, QMutexLocker, QTimer
 
 MIN_OSM_FILE_SIZE = 1024 * 10 
+LOG_FLUSH_INTERVAL_MS = 50
+ROUTE_READ_CHUNK_SIZE = 1024 * 1024
 
 class PlotViewer(QWidget):
-    """A QWidget that contains a Matplotlib figure."""
+    """A QWidget that shows the most used edges as a pyqtgraph bar chart."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
-        self.canvas = None
+        self.plot_widget = None
         
-    def set_plot(self, figure: Figure, filename: str):
-        """Removes old canvas and adds a new one based on the given Figure."""
-        if self.canvas:
-            self.layout.removeWidget(self.canvas)
-            self.canvas.deleteLater()
-            
-        self.canvas = FigureCanvas(figure)
-        self.layout.addWidget(self.canvas)
+    def set_plot(self, top_edges: List[Tuple[str, int]], filename: str):
+        """Replaces the current bars with one horizontal bar per (edge, count) pair."""
+        # pyqtgraph is only imported once there is something to plot
+        import pyqtgraph as pg
+
+        if self.plot_widget is None:
+            self.plot_widget = pg.PlotWidget(background='w')
+            self.plot_widget.invertY(True)
+            self.plot_widget.setLabel('bottom', 'Number of Vehicles Traversed')
+            self.layout.addWidget(self.plot_widget)
+
+        edges = [item[0] for item in top_edges]
+        counts = [item[1] for item in top_edges]
+        y_pos = list(range(len(counts)))
+
+        self.plot_widget.clear()
+        self.plot_widget.addItem(pg.BarGraphItem(x0=0, y=y_pos, height=0.8, width=counts, brush='#0078D7'))
+        self.plot_widget.getAxis('left').setTicks([list(zip(y_pos, edges))])
+
+        for i, count in enumerate(counts):
+            label = pg.TextItem(f' {count:,}', color='k', anchor=(0, 0.5))
+            label.setPos(count, i)
+            self.plot_widget.addItem(label)
+
+        self.plot_widget.setTitle(f'Top {len(top_edges)} Most Used Edges in Route File')
         self.setWindowTitle(f"Edge Usage: {filename}")
-        self.update()
-def create_most_used_edges_plot(top_edges: List[Tuple[str, int]], filename: str) -> Optional[Figure]:
-    if not top_edges:
-        return None
 
-    edges = [item[0] for item in top_edges]
-    counts = [item[1] for item in top_edges]
-    
-    fig = Figure(figsize=(10, 6))
-    ax = fig.add_subplot(111)
-    
-    y_pos = range(len(counts))
-    ax.barh(y_pos, counts, align='center', color='#0078D7')
-    
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(edges)
-    
-    for i, count in enumerate(counts):
-        ax.text(count, i, f' {count:,}', va='center')
+def _osm_is_valid(path: str) -> bool:
+    """True if the OSM file exists and is large enough to hold real map data."""
+    try:
+        return os.stat(path).st_size > MIN_OSM_FILE_SIZE
+    except OSError:
+        return False
 
-    ax.invert_yaxis()
-    ax.set_xlabel('Number of Vehicles Traversed')
-    ax.set_title(f'Top {len(top_edges)} Most Used Edges in Route File')
-    
-    fig.tight_layout()
-    return fig
+class EdgeUsageCounter:
+    """XMLParser target that counts the edges of the first <route> directly inside each <vehicle>.
+
+    Start events alone cannot tell <vehicle/><route .../> from <vehicle><route .../></vehicle>,
+    so end() tracks depth to know when a vehicle has closed.
+    """
+    def __init__(self):
+        self.edge_counts = Counter()
+        self._depth = 0
+        self._vehicle_depth = None
+        self._route_counted = False
+
+    def start(self, tag, attrs):
+        self._depth += 1
+        if tag == 'vehicle':
+            self._vehicle_depth = self._depth
+            self._route_counted = False
+        elif (tag == 'route' and self._vehicle_depth == self._depth - 1
+              and not self._route_counted):
+            # duarouter writes one embedded route per vehicle; anything after it is skipped
+            self._route_counted = True
+            edges_list_str = attrs.get("edges")
+            if edges_list_str:
+                self.edge_counts.update(edges_list_str.split())
+
+    def end(self, tag):
+        if self._depth == self._vehicle_depth:
+            self._vehicle_depth = None
+        self._depth -= 1
+
+    def close(self):
+        return self.edge_counts
 
 MAP_HTML = """
 <!DOCTYPE html>
@@ -128,118 +161,167 @@ MAP_HTML = """
 </body>
 </html>
 """
-class SumoWorker(QThread):
-    log_signal = pyqtSignal(str)    
-    finished_signal = pyqtSignal(bool, object) 
-    
-    def __init__(self, config):
-        super().__init__()
-        self.filename = config['filename']
-        self.bbox = config['bbox'] 
-        self.end_time = config['end_time']
-        self.num_trips = config['num_trips']
-        self.sumo_home = ""
-        self.attack_start = config.get('attack_start', 100)
-        self.attack_duration = config.get('attack_duration', 500)
+LAUNCHD_TEMPLATE = string.Template("""<?xml version="1.0"?>
+<launch>
+    <copy file="${filename}.net.xml" />
+    <copy file="${filename}.rou.xml" />
+    <copy file="${filename}.poly.xml" />
+    <copy file="${filename}_${type}.sumo.cfg" type="config" />
+</launch>""")
 
-    def run(self):
-        self.log_signal.emit("--- Starting SUMO Generation Process ---")
-        
-        if not self.find_sumo_and_add_path():
-            self.log_signal.emit("❌ Error: SUMO_HOME not found.")
-            self.finished_signal.emit(False, None)
-            return
+SUMOCFG_TEMPLATE = string.Template("""<configuration>
+    <input>
+        <net-file value="${filename}.net.xml"/>
+        <route-files value="${route_file}"/>
+        <additional-files value="${filename}.poly.xml"/>
+    </input>
+    <time>
+        <begin value="0"/>
+        <end value="${end_time}"/>
+    </time>
+    <processing>
+        <ignore-route-errors value="true"/>
+        <waiting-time-memory value="${end_time}"/>
+        <time-to-teleport value="-1"/> 
+        </processing>
+    <output>
+        <summary-output value="${summary_output}"/>
+        <tripinfo-output value="${tripinfo_output}"/>
+    </output>
+</configuration>""")
 
-        plot_figure = None
-        try:
-            success, launch_clean , launch_blocked, cfg_clean , plot_figure , cfg_blocked = self.create_files() 
-            
-            if success:
-                self.log_signal.emit("\n✨ PROCESS COMPLETE ✨")
-                self.log_signal.emit(f"Veins Clean Launch File: {launch_clean}")
-                self.log_signal.emit(f"Veins Blocked Launch File: {launch_blocked}")
-                self.log_signal.emit(f"Clean SUMO Config File: {cfg_clean}")
-                self.log_signal.emit(f"Blocked SUMO Config File: {cfg_blocked}")
-                self.finished_signal.emit(True, plot_figure) 
-            else:
-                self.finished_signal.emit(False, None)
-        except Exception as e:
-            import traceback
-            self.log_signal.emit(f"❌ Unexpected Error: {str(e)}")
-            self.log_signal.emit(traceback.format_exc())
-            self.finished_signal.emit(False, None)
+CLEAN_OMNETPP_INI_TEMPLATE = string.Template("""[General]
+cmdenv-express-mode = true
+cmdenv-autoflush = true
+cmdenv-status-frequency = 1s
+**.cmdenv-log-level = info
 
-    def log(self, msg):
-        self.log_signal.emit(msg)
+image-path = ../../images
 
-    def find_sumo_and_add_path(self) -> bool:
-        sumo_home = os.environ.get('SUMO_HOME')
-        if not sumo_home:
-            sumo_bin = shutil.which("sumo")
-            if sumo_bin:
-                sumo_home = os.path.dirname(os.path.dirname(sumo_bin))
-        if not sumo_home:
-            defaults = {
-                "Windows": [r"C:\Program Files (x86)\Eclipse\Sumo", r"C:\Sumo"],
-                "Linux": ["/usr/share/sumo", "/usr/local/share/sumo"],
-                "Darwin": ["/opt/homebrew/opt/sumo/share/sumo", "/usr/local/opt/sumo/share/sumo"]
-            }
-            system = platform.system()
-            for path in defaults.get(system, []):
-                if os.path.exists(path):
-                    sumo_home = path
-                    break
-        if sumo_home and os.path.exists(os.path.join(sumo_home, 'tools')):
-            self.sumo_home = sumo_home
-            os.environ['SUMO_HOME'] = sumo_home
+network = RSUExampleScenario
 
-            tools = os.path.join(self.sumo_home, 'tools')
-            if tools not in sys.path:
-                sys.path.append(tools)
+##########################################################
+#            Simulation parameters                       #
+##########################################################
+debug-on-errors = true
+print-undisposed = true
 
-            self.log(f"✅ Found SUMO_HOME: {self.sumo_home}")
-            return True
+sim-time-limit = ${end_time}s
 
-        self.log("❌ Error: Could not automatically locate SUMO installation.")
-        return False
+**.scalar-recording = true
+**.vector-recording = true
 
-    def run_command(self, command: List[str], description: str) -> bool:
-        self.log(f"\n▶️ Running: {description}...")
-        try:
-            process = subprocess.Popen(
-                command, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            stdout, stderr = process.communicate()
-            
-            if stdout: self.log(f"[STDOUT] {stdout[:500]}..." if len(stdout)>500 else f"[STDOUT] {stdout}")
-            if stderr: self.log(f"[STDERR] {stderr[:500]}..." if len(stderr)>500 else f"[STDERR] {stderr}")
-            
-            if process.returncode == 0:
-                self.log(f"✅ {description} finished successfully.")
-                return True
-            else:
-                self.log(f"❌ {description} failed with return code {process.returncode}.")
-                return False
-        except FileNotFoundError:
-            self.log(f"❌ Command not found: {command[0]}")
-            return False
-        except Exception as e:
-            self.log(f"❌ Error executing {description}: {e}")
-            return False
-    def cleanup(self, filename):
-        files = ["routes.rou.xml", f"{filename}.rou.alt.xml", f"{filename}.trip.xml"]
-        for f in files:
-            if os.path.exists(f):
-                try:
-                    os.remove(f)
-                    self.log(f"Removed temp file: {f}")
-                except: pass 
-    def generate_Blocked_omnetini_File(self, filename , pg_x, pg_y, rsu_x, rsu_y, end_time ,target_edge: str , type : str):
-        content = f"""[General]
+*.playgroundSizeX = ${pg_x}m
+*.playgroundSizeY = ${pg_y}m
+*.playgroundSizeZ = 50m
+
+
+##########################################################
+# Annotation parameters                                  #
+##########################################################
+*.annotations.draw = true
+
+##########################################################
+# Obstacle parameters                                    #
+##########################################################
+*.obstacles.obstacles = xmldoc("config.xml", "//AnalogueModel[@type='SimpleObstacleShadowing']/obstacles")
+
+##########################################################
+#            TraCIScenarioManager parameters             #
+##########################################################
+*.manager.updateInterval = 1s
+*.manager.host = "localhost"
+*.manager.port = 9999
+*.manager.autoShutdown = true
+*.manager.launchConfig = xmldoc("${filename}_${type}.launchd.xml")
+*.manager.trafficLightModuleType = "org.car2x.veins.nodes.TrafficLight"
+
+*.tls[*].mobility.x = 0
+*.tls[*].mobility.y = 0
+*.tls[*].mobility.z = 3
+
+*.tls[*].applType = "org.car2x.veins.modules.application.traci.TraCIDemoTrafficLightApp"
+*.tls[*].logicType ="org.car2x.veins.modules.world.traci.trafficLight.logics.TraCITrafficLightSimpleLogic"
+
+
+##########################################################
+#                       RSU SETTINGS                     #
+#                                                        #
+#                                                        #
+##########################################################
+*.rsu[0].mobility.x = ${rsu_x}
+*.rsu[0].mobility.y = ${rsu_y}
+*.rsu[0].mobility.z = 3
+
+*.rsu[*].applType = "TraCIDemoRSU11p"
+*.rsu[*].appl.headerLength = 80 bit
+*.rsu[*].appl.sendBeacons = false
+*.rsu[*].appl.dataOnSch = false
+*.rsu[*].appl.beaconInterval = 1s
+*.rsu[*].appl.beaconUserPriority = 7
+*.rsu[*].appl.dataUserPriority = 5
+*.rsu[*].nic.phy80211p.antennaOffsetZ = 0 m
+
+##########################################################
+#            11p specific parameters                     #
+#                                                        #
+#                    NIC-Settings                        #
+##########################################################
+*.connectionManager.sendDirect = true
+*.connectionManager.maxInterfDist = 2600m
+*.connectionManager.drawMaxIntfDist = false
+
+*.**.nic.mac1609_4.useServiceChannel = false
+
+*.**.nic.mac1609_4.txPower = 20mW
+*.**.nic.mac1609_4.bitrate = 6Mbps
+*.**.nic.phy80211p.minPowerLevel = -110dBm
+
+*.**.nic.phy80211p.useNoiseFloor = true
+*.**.nic.phy80211p.noiseFloor = -98dBm
+
+*.**.nic.phy80211p.decider = xmldoc("config.xml")
+*.**.nic.phy80211p.analogueModels = xmldoc("config.xml")
+*.**.nic.phy80211p.usePropagationDelay = true
+
+*.**.nic.phy80211p.antenna = xmldoc("antenna.xml", "/root/Antenna[@id='monopole']")
+*.node[*].nic.phy80211p.antennaOffsetY = 0 m
+*.node[*].nic.phy80211p.antennaOffsetZ = 1.895 m
+
+##########################################################
+#                      App Layer                         #
+##########################################################
+*.node[*].applType = "TraCIDemo11p"
+*.node[*].appl.headerLength = 80 bit
+*.node[*].appl.sendBeacons = false
+*.node[*].appl.dataOnSch = false
+*.node[*].appl.beaconInterval = 1s
+
+##########################################################
+#                      Mobility                          #
+##########################################################
+*.node[*].veinsmobility.x = 0
+*.node[*].veinsmobility.y = 0
+*.node[*].veinsmobility.z = 0
+*.node[*].veinsmobility.setHostSpeed = false
+*.node[*0].veinsmobility.accidentCount = 1
+*.node[*0].veinsmobility.accidentStart = 73s
+*.node[*0].veinsmobility.accidentDuration = 50s
+
+[Config Default]
+
+[Config WithBeaconing]
+*.rsu[*].appl.sendBeacons = true
+*.node[*].appl.sendBeacons = true
+
+[Config WithChannelSwitching]
+*.**.nic.mac1609_4.useServiceChannel = true
+*.node[*].appl.dataOnSch = true
+*.rsu[*].appl.dataOnSch = true
+
+""")
+
+BLOCKED_OMNETPP_INI_TEMPLATE = string.Template("""[General]
 cmdenv-express-mode = true
 cmdenv-autoflush = true
 cmdenv-status-frequency = 1s
@@ -255,13 +337,13 @@ network = RSUExampleScenario
 debug-on-errors = true
 print-undisposed = true
 
-sim-time-limit = {end_time}s
+sim-time-limit = ${end_time}s
 
 **.scalar-recording = true
 **.vector-recording = true
 
-*.playgroundSizeX = {pg_x}m
-*.playgroundSizeY = {pg_y}m
+*.playgroundSizeX = ${pg_x}m
+*.playgroundSizeY = ${pg_y}m
 *.playgroundSizeZ = 50m
 
 
@@ -282,7 +364,7 @@ sim-time-limit = {end_time}s
 *.manager.host = "localhost"
 *.manager.port = 9999
 *.manager.autoShutdown = true
-*.manager.launchConfig = xmldoc("{filename}_{type}.launchd.xml")
+*.manager.launchConfig = xmldoc("${filename}_${type}.launchd.xml")
 *.manager.trafficLightModuleType = "org.car2x.veins.nodes.TrafficLight"
 
 *.tls[*].mobility.x = 0
@@ -298,14 +380,14 @@ sim-time-limit = {end_time}s
 #                                                        #
 #                                                        #
 ##########################################################
-*.rsu[0].mobility.x = {rsu_x}
-*.rsu[0].mobility.y = {rsu_y}
+*.rsu[0].mobility.x = ${rsu_x}
+*.rsu[0].mobility.y = ${rsu_y}
 *.rsu[0].mobility.z = 3
 
 *.rsu[*].applType = "TraCIDemoRSU11p"
-*.rsu[*].appl.attackLaneId     = "{target_edge}_0"
-*.rsu[*].appl.attackStartTime  = {self.attack_start}s      
-*.rsu[*].appl.attackDuration   = {self.attack_duration}s      
+*.rsu[*].appl.attackLaneId     = "${target_edge}_0"
+*.rsu[*].appl.attackStartTime  = ${attack_start}s      
+*.rsu[*].appl.attackDuration   = ${attack_duration}s      
 *.rsu[*].appl.headerLength = 80 bit
 *.rsu[*].appl.sendBeacons = false
 *.rsu[*].appl.dataOnSch = false
@@ -371,9 +453,144 @@ sim-time-limit = {end_time}s
 *.node[*].appl.dataOnSch = true
 *.rsu[*].appl.dataOnSch = true
 
-"""
+""")
+
+class SumoWorker(QThread):
+    log_signal = pyqtSignal(str)    
+    finished_signal = pyqtSignal(bool, object) 
+    
+    def __init__(self, config):
+        super().__init__()
+        self.filename = config['filename']
+        self.bbox = config['bbox'] 
+        self.end_time = config['end_time']
+        self.num_trips = config['num_trips']
+        self.sumo_home = ""
+        self.osm_get = ""
+        self.random_trips = ""
+        self.typemap = ""
+        self.typemap_exists = False
+        self.attack_start = config.get('attack_start', 100)
+        self.attack_duration = config.get('attack_duration', 500)
+        self._log_mutex = QMutex()
+
+    def run(self):
+        self.log_signal.emit("--- Starting SUMO Generation Process ---")
+        
+        if not self.find_sumo_and_add_path():
+            self.log_signal.emit("❌ Error: SUMO_HOME not found.")
+            self.finished_signal.emit(False, None)
+            return
+
+        top_edges = None
+        try:
+            success, launch_clean , launch_blocked, cfg_clean , top_edges , cfg_blocked = self.create_files() 
+            
+            if success:
+                self.log_signal.emit("\n✨ PROCESS COMPLETE ✨")
+                self.log_signal.emit(f"Veins Clean Launch File: {launch_clean}")
+                self.log_signal.emit(f"Veins Blocked Launch File: {launch_blocked}")
+                self.log_signal.emit(f"Clean SUMO Config File: {cfg_clean}")
+                self.log_signal.emit(f"Blocked SUMO Config File: {cfg_blocked}")
+                self.finished_signal.emit(True, top_edges) 
+            else:
+                self.finished_signal.emit(False, None)
+        except Exception as e:
+            import traceback
+            self.log_signal.emit(f"❌ Unexpected Error: {str(e)}")
+            self.log_signal.emit(traceback.format_exc())
+            self.finished_signal.emit(False, None)
+
+    def log(self, msg):
+        with QMutexLocker(self._log_mutex):
+            self.log_signal.emit(msg)
+
+    def find_sumo_and_add_path(self) -> bool:
+        sumo_home = os.environ.get('SUMO_HOME')
+        if not sumo_home:
+            sumo_bin = shutil.which("sumo")
+            if sumo_bin:
+                sumo_home = os.path.dirname(os.path.dirname(sumo_bin))
+        if not sumo_home:
+            defaults = {
+                "Windows": [r"C:\Program Files (x86)\Eclipse\Sumo", r"C:\Sumo"],
+                "Linux": ["/usr/share/sumo", "/usr/local/share/sumo"],
+                "Darwin": ["/opt/homebrew/opt/sumo/share/sumo", "/usr/local/opt/sumo/share/sumo"]
+            }
+            system = platform.system()
+            for path in defaults.get(system, []):
+                if os.path.exists(path):
+                    sumo_home = path
+                    break
+        if sumo_home and os.path.exists(os.path.join(sumo_home, 'tools')):
+            self.sumo_home = sumo_home
+            os.environ['SUMO_HOME'] = sumo_home
+
+            tools = os.path.join(self.sumo_home, 'tools')
+            if tools not in sys.path:
+                sys.path.append(tools)
+
+            # Resolve the SUMO helper paths once for the whole pipeline
+            self.osm_get = os.path.join(tools, 'osmGet.py')
+            self.random_trips = os.path.join(tools, 'randomTrips.py')
+            self.typemap = os.path.join(self.sumo_home, 'data', 'typemap', 'osmPolyconvert.typ.xml')
+            self.typemap_exists = os.path.exists(self.typemap)
+
+            self.log(f"✅ Found SUMO_HOME: {self.sumo_home}")
+            return True
+
+        self.log("❌ Error: Could not automatically locate SUMO installation.")
+        return False
+
+    def run_command(self, command: List[str], description: str) -> bool:
+        self.log(f"\n▶️ Running: {description}...")
+        try:
+            process = subprocess.Popen(
+                command, 
+                stdout=subprocess.PIPE, 
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors='replace',
+                bufsize=1
+            )
+            
+            # Forward output as it is produced instead of buffering it until exit
+            try:
+                for line in process.stdout:
+                    self.log(f"[{description}] {line.rstrip()}")
+            finally:
+                # Never leave the child blocked on a pipe nobody reads any more
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+                process.stdout.close()
+            
+            if process.returncode == 0:
+                self.log(f"✅ {description} finished successfully.")
+                return True
+            else:
+                self.log(f"❌ {description} failed with return code {process.returncode}.")
+                return False
+        except FileNotFoundError:
+            self.log(f"❌ Command not found: {command[0]}")
+            return False
+        except Exception as e:
+            self.log(f"❌ Error executing {description}: {e}")
+            return False
+    def cleanup(self, filename):
+        files = ["routes.rou.xml", f"{filename}.rou.alt.xml", f"{filename}.trip.xml"]
+        for f in files:
+            if os.path.exists(f):
+                try:
+                    os.remove(f)
+                    self.log(f"Removed temp file: {f}")
+                except: pass 
+    def generate_Blocked_omnetini_File(self, filename , pg_x, pg_y, rsu_x, rsu_y, end_time ,target_edge: str , type : str):
         name = f"{filename}_Blocked.omnetpp.ini"
-        with open(name, 'w') as f: f.write(content)
+        content = BLOCKED_OMNETPP_INI_TEMPLATE.substitute(
+            filename=filename, type=type, end_time=end_time, pg_x=pg_x, pg_y=pg_y, rsu_x=rsu_x, rsu_y=rsu_y,
+            target_edge=target_edge, attack_start=self.attack_start, attack_duration=self.attack_duration)
+        Path(name).write_text(content)
         self.log(f"Created {name}")
         return name         
     def most_used_route_finder(self, route_file: str, top_n: int = 10) -> List[Tuple[str, int]]:
@@ -382,28 +599,23 @@ sim-time-limit = {end_time}s
             return []
 
         self.log(f"\n🔬 Starting analysis of most used edges in '{route_file}'...")
-        edge_counts = Counter()
-        total_edges = 0
+        counter = EdgeUsageCounter()
 
         try:
-            tree = ET.parse(route_file)
-            root = tree.getroot()
-            
-            for vehicle in root.iter('vehicle'):
-                route_element = vehicle.find('route')
-                
-                if route_element is not None:
-                    edges_list_str = route_element.get("edges")
-                    
-                    if edges_list_str:
-                        edge_ids = edges_list_str.split()
-                        edge_counts.update(edge_ids)
-                        total_edges += len(edge_ids)
-
+            parser = ET.XMLParser(target=counter)
+            with open(route_file, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    # Ask the kernel for aggressive read-ahead so disk reads overlap parsing
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                while chunk := f.read(ROUTE_READ_CHUNK_SIZE):
+                    parser.feed(chunk)
+            parser.close()
         except Exception as e:
             self.log(f"❌ Error during route analysis: {e}")
             return []
 
+        edge_counts = counter.edge_counts
+        total_edges = sum(edge_counts.values())
         most_common_edges = edge_counts.most_common(top_n)
 
         # Log the results to the GUI
@@ -417,7 +629,7 @@ sim-time-limit = {end_time}s
             self.log(f"* **{edge_id}**: {count:,} times ({percentage:.2f}%)") 
         return most_common_edges
         
-    def create_files(self) -> Tuple[bool, str, str, Optional[Figure]]:
+    def create_files(self) -> Tuple[bool, str, str, str, Optional[List[Tuple[str, int]]], str]:
         filename = self.filename
         osm_file = f"{filename}.osm"
         net_file = f"{filename}.net.xml"
@@ -426,31 +638,30 @@ sim-time-limit = {end_time}s
         route_file = f"{filename}.rou.xml"
         self.log("--- Step 1: Map Data Setup ---")
         
-        osm_file_exists = os.path.exists(osm_file)
-        should_download = True 
+        should_download = not _osm_is_valid(osm_file)
 
-        if osm_file_exists:
+        if not should_download:
             file_size = os.path.getsize(osm_file)
-            
-            if file_size > MIN_OSM_FILE_SIZE:
-                self.log(f"✅ Found existing OSM file: '{osm_file}' (Size: {file_size // 1024} KB)")
-                self.log("ℹ️ Skipping download step and using existing file.")
-                should_download = False # File is valid, skip download
-            else:
-                self.log(f"⚠️ Found file '{osm_file}', but size ({file_size} bytes) is too small (<{MIN_OSM_FILE_SIZE} bytes).")
-                self.log("ℹ️ Re-downloading map data to ensure completeness.")
-                # should_download remains True
+            self.log(f"✅ Found existing OSM file: '{osm_file}' (Size: {file_size // 1024} KB)")
+            self.log("ℹ️ Skipping download step and using existing file.")
+        elif os.path.exists(osm_file):
+            file_size = os.path.getsize(osm_file)
+            self.log(f"⚠️ Found file '{osm_file}', but size ({file_size} bytes) is too small (<{MIN_OSM_FILE_SIZE} bytes).")
+            self.log("ℹ️ Re-downloading map data to ensure completeness.")
 
         if should_download:
             self.log(f"ℹ️ Starting download...")
             
-            download_script = os.path.join(self.sumo_home, 'tools', 'osmGet.py')
             bbox_str = f"{self.bbox['west']},{self.bbox['south']},{self.bbox['east']},{self.bbox['north']}"
             
-            cmd = [sys.executable, download_script, f"--bbox={bbox_str}", "-p", filename, "-d", "."]
+            cmd = [sys.executable, self.osm_get, f"--bbox={bbox_str}", "-p", filename, "-d", "."]
             
-            if not self.run_command(cmd, "OSM Download"): return False, "", "", None
-            generated_files = glob.glob(f"{filename}*_bbox.osm.xml")
+            if not self.run_command(cmd, "OSM Download"): return False, "", "", "", None, ""
+            # One listing of the map's own directory finds osmGet's output, whatever its suffix
+            osm_dir = os.path.dirname(filename) or '.'
+            names = [entry.name for entry in os.scandir(osm_dir)]
+            generated_files = [os.path.join(osm_dir, name) for name in
+                               fnmatch.filter(names, f"{os.path.basename(filename)}*_bbox.osm.xml")]
             
             if generated_files:
                 generated_file = generated_files[0]
@@ -462,7 +673,7 @@ sim-time-limit = {end_time}s
                 self.log(f"✅ Renamed '{filename}.osm.xml' to '{osm_file}'")
             else:
                 self.log(f"❌ Error: Download finished but expected output file not found.")
-                return False, "", "", None
+                return False, "", "", "", None, ""
         self.log("--- Step 2: Converting to Network (Netconvert) ---")
         net_cmd = [
     "netconvert", 
@@ -475,61 +686,61 @@ sim-time-limit = {end_time}s
     "--geometry.remove",             # Simplifies road shapes for better performance
     "--roundabouts.guess"            # Identifies roundabouts for better routing
 ]
-        if not self.run_command(net_cmd, "Netconvert"): return False, "", "", None
         self.log("--- Step 3: Generating Polygons (Polyconvert) ---")
-        typemap = os.path.join(self.sumo_home, 'data', 'typemap', 'osmPolyconvert.typ.xml')
-        if os.path.exists(typemap):
-            self.run_command(["polyconvert", "--osm-files", osm_file, "--type-file", typemap, "-o", poly_file], "Polyconvert")
-        else:
-            self.log("⚠️ Typemap not found, skipping Polyconvert.")
+        # Polyconvert only needs the OSM file, so it runs alongside Netconvert
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            net_future = executor.submit(self.run_command, net_cmd, "Netconvert")
+            if self.typemap_exists:
+                executor.submit(self.run_command, ["polyconvert", "--osm-files", osm_file, "--type-file", self.typemap, "-o", poly_file], "Polyconvert")
+            else:
+                self.log("⚠️ Typemap not found, skipping Polyconvert.")
+            net_ok = net_future.result()
+        if not net_ok: return False, "", "", "", None, ""
         self.log("--- Step 4: Generating Random Trips ---")
-        random_trips_script = os.path.join(self.sumo_home, 'tools', 'randomTrips.py')
         trip_period = self.end_time / self.num_trips
         
         trips_cmd = [
-            sys.executable, random_trips_script,
+            sys.executable, self.random_trips,
             "-n", net_file,
             "-o", trip_file,
             "-e", str(self.end_time),
-            "-p", str(trip_period),
-            "--validate"
+            "-p", str(trip_period)
         ]
-        if not self.run_command(trips_cmd, "Random Trips"): return False, "", "", None
+        if not self.run_command(trips_cmd, "Random Trips"): return False, "", "", "", None, ""
         self.log("--- Step 5: Calculating Routes (DUAROUTER) ---")
         dua_cmd = [
             "duarouter",
             "-n", net_file,
             "-t", trip_file,
-            "-o", route_file
+            "-o", route_file,
+            "--ignore-errors"                # Drops unroutable trips instead of aborting
         ]
-        if not self.run_command(dua_cmd, "DUAROUTER"): return False, "", "", None
+        if not self.run_command(dua_cmd, "DUAROUTER"): return False, "", "", "", None, ""
         self.log("--- Step 6: Analyzing Route Usage and Plotting ---")
         
         top_edges_list = self.most_used_route_finder(route_file, top_n=10)
-        plot_figure = None
         
         if top_edges_list:
-            plot_figure = create_most_used_edges_plot(top_edges_list, filename)
-            self.log("📊 Graphical Report Figure created successfully.")
+            self.log("📊 Edge usage data ready for the Route Analysis Plot tab.")
         else:
             self.log("⚠️ Plotting skipped: No edges found in the route file.")
         self.log("--- Step 7: Writing Configuration Files ---")
-        launchd_clean = self.generate_launchd(filename , "Clean")
-        launched_blocked = self.generate_launchd(filename , "Blocked")
-        sumocfg_clean = self.generate_sumocfg(filename, route_file , "Clean")
-        sumocfg_blocked = self.generate_sumocfg(filename, route_file , "Blocked")
         self.log("ℹ️ Extracting coordinates from net.xml...")
         try:
-            tree = ET.parse(net_file)
-            location_element = tree.find('.//location')
-            if location_element is not None:
-                conv_boundary_str = location_element.get('convBoundary')
+            # <location> sits at the top of net.xml, so stop reading once it is seen
+            conv_boundary_str = None
+            with open(net_file, 'rb') as f:
+                for _, element in ET.iterparse(f, events=('start',)):
+                    if element.tag == 'location':
+                        conv_boundary_str = element.get('convBoundary')
+                        break
+            if conv_boundary_str is not None:
                 min_x, min_y, max_x, max_y = map(float, conv_boundary_str.split(','))
             else:
                 raise ValueError("Location tag not found in net.xml.")
         except Exception as e:
             self.log(f"❌ Error extracting coordinates: {e}")
-            return False, "", "", None
+            return False, "", "", "", None, ""
         PERCENTAGE_INCREASE = 0.50 
         original_width = max_x - min_x
         original_height = max_y - min_y
@@ -541,190 +752,50 @@ sim-time-limit = {end_time}s
         play_ground_y_final = original_height + BUFFER_SIZE_Y
         rsu_x_shifted = (original_width / 2.0) + OFFSET_X
         rsu_y_shifted = (original_height / 2.0) + OFFSET_Y
-        clean_ini = self.generate_omnetpp_ini(filename , play_ground_x_final , play_ground_y_final , rsu_x_shifted , rsu_y_shifted , self.end_time , "Clean")
         target_edge = top_edges_list[0][0]
-        blocked_ini = self.generate_Blocked_omnetini_File(filename , play_ground_x_final , play_ground_y_final , rsu_x_shifted , rsu_y_shifted , self.end_time , target_edge , "Blocked")
+        # The config writers touch independent files, so they share one pool
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            launchd_clean = executor.submit(self.generate_launchd, filename , "Clean")
+            launched_blocked = executor.submit(self.generate_launchd, filename , "Blocked")
+            sumocfg_clean = executor.submit(self.generate_sumocfg, filename, route_file , "Clean")
+            sumocfg_blocked = executor.submit(self.generate_sumocfg, filename, route_file , "Blocked")
+            clean_ini = executor.submit(self.generate_omnetpp_ini, filename , play_ground_x_final , play_ground_y_final , rsu_x_shifted , rsu_y_shifted , self.end_time , "Clean")
+            blocked_ini = executor.submit(self.generate_Blocked_omnetini_File, filename , play_ground_x_final , play_ground_y_final , rsu_x_shifted , rsu_y_shifted , self.end_time , target_edge , "Blocked")
+        launchd_clean, launched_blocked = launchd_clean.result(), launched_blocked.result()
+        sumocfg_clean, sumocfg_blocked = sumocfg_clean.result(), sumocfg_blocked.result()
+        clean_ini.result(); blocked_ini.result()
         self.log("--- Step 8: Cleaning up ---")
         self.cleanup(filename)
-        return True, launchd_clean, launched_blocked , sumocfg_clean, plot_figure , sumocfg_blocked 
+        return True, launchd_clean, launched_blocked , sumocfg_clean, top_edges_list , sumocfg_blocked 
     def generate_launchd(self, filename , type : str):
-        content = f"""<?xml version="1.0"?>
-<launch>
-    <copy file="{filename}.net.xml" />
-    <copy file="{filename}.rou.xml" />
-    <copy file="{filename}.poly.xml" />
-    <copy file="{filename}_{type}.sumo.cfg" type="config" />
-</launch>"""
+        content = LAUNCHD_TEMPLATE.substitute(filename=filename, type=type)
         name = f"{filename}_{type}.launchd.xml"
-        with open(name, 'w') as f: f.write(content)
+        Path(name).write_text(content)
         self.log(f"Created {name}")
         return name
 
     def generate_sumocfg(self, filename, route_file , type : str):
         log_dir = f"{filename}-logs"
-        if not os.path.exists(log_dir):
+        try:
             os.makedirs(log_dir)
             self.log(f"✅ Created output directory: {log_dir}/")
+        except FileExistsError:
+            pass
         os.makedirs(os.getcwd() , exist_ok=True)
         summary_output = os.path.join(os.getcwd(), f"{log_dir}/{filename}_{type}_summary_output.xml")
         tripinfo_output = os.path.join(os.getcwd(), f"{log_dir}/{filename}_{type}_tripinfo_output.xml")
-        content = f"""<configuration>
-    <input>
-        <net-file value="{filename}.net.xml"/>
-        <route-files value="{route_file}"/>
-        <additional-files value="{filename}.poly.xml"/>
-    </input>
-    <time>
-        <begin value="0"/>
-        <end value="{self.end_time}"/>
-    </time>
-    <processing>
-        <ignore-route-errors value="true"/>
-        <waiting-time-memory value="{self.end_time}"/>
-        <time-to-teleport value="-1"/> 
-        </processing>
-    <output>
-        <summary-output value="{summary_output}"/>
-        <tripinfo-output value="{tripinfo_output}"/>
-    </output>
-</configuration>"""
+        content = SUMOCFG_TEMPLATE.substitute(
+            filename=filename, route_file=route_file, end_time=self.end_time,
+            summary_output=summary_output, tripinfo_output=tripinfo_output)
         name = f"{filename}_{type}.sumo.cfg"
-        with open(name, 'w') as f: f.write(content)
+        Path(name).write_text(content)
         self.log(f"Created {name}")
         return name
     def generate_omnetpp_ini(self, filename , pg_x, pg_y, rsu_x, rsu_y, end_time , type : str):
-        content = f"""[General]
-cmdenv-express-mode = true
-cmdenv-autoflush = true
-cmdenv-status-frequency = 1s
-**.cmdenv-log-level = info
-
-image-path = ../../images
-
-network = RSUExampleScenario
-
-##########################################################
-#            Simulation parameters                       #
-##########################################################
-debug-on-errors = true
-print-undisposed = true
-
-sim-time-limit = {end_time}s
-
-**.scalar-recording = true
-**.vector-recording = true
-
-*.playgroundSizeX = {pg_x}m
-*.playgroundSizeY = {pg_y}m
-*.playgroundSizeZ = 50m
-
-
-##########################################################
-# Annotation parameters                                  #
-##########################################################
-*.annotations.draw = true
-
-##########################################################
-# Obstacle parameters                                    #
-##########################################################
-*.obstacles.obstacles = xmldoc("config.xml", "//AnalogueModel[@type='SimpleObstacleShadowing']/obstacles")
-
-##########################################################
-#            TraCIScenarioManager parameters             #
-##########################################################
-*.manager.updateInterval = 1s
-*.manager.host = "localhost"
-*.manager.port = 9999
-*.manager.autoShutdown = true
-*.manager.launchConfig = xmldoc("{filename}_{type}.launchd.xml")
-*.manager.trafficLightModuleType = "org.car2x.veins.nodes.TrafficLight"
-
-*.tls[*].mobility.x = 0
-*.tls[*].mobility.y = 0
-*.tls[*].mobility.z = 3
-
-*.tls[*].applType = "org.car2x.veins.modules.application.traci.TraCIDemoTrafficLightApp"
-*.tls[*].logicType ="org.car2x.veins.modules.world.traci.trafficLight.logics.TraCITrafficLightSimpleLogic"
-
-
-##########################################################
-#                       RSU SETTINGS                     #
-#                                                        #
-#                                                        #
-##########################################################
-*.rsu[0].mobility.x = {rsu_x}
-*.rsu[0].mobility.y = {rsu_y}
-*.rsu[0].mobility.z = 3
-
-*.rsu[*].applType = "TraCIDemoRSU11p"
-*.rsu[*].appl.headerLength = 80 bit
-*.rsu[*].appl.sendBeacons = false
-*.rsu[*].appl.dataOnSch = false
-*.rsu[*].appl.beaconInterval = 1s
-*.rsu[*].appl.beaconUserPriority = 7
-*.rsu[*].appl.dataUserPriority = 5
-*.rsu[*].nic.phy80211p.antennaOffsetZ = 0 m
-
-##########################################################
-#            11p specific parameters                     #
-#                                                        #
-#                    NIC-Settings                        #
-##########################################################
-*.connectionManager.sendDirect = true
-*.connectionManager.maxInterfDist = 2600m
-*.connectionManager.drawMaxIntfDist = false
-
-*.**.nic.mac1609_4.useServiceChannel = false
-
-*.**.nic.mac1609_4.txPower = 20mW
-*.**.nic.mac1609_4.bitrate = 6Mbps
-*.**.nic.phy80211p.minPowerLevel = -110dBm
-
-*.**.nic.phy80211p.useNoiseFloor = true
-*.**.nic.phy80211p.noiseFloor = -98dBm
-
-*.**.nic.phy80211p.decider = xmldoc("config.xml")
-*.**.nic.phy80211p.analogueModels = xmldoc("config.xml")
-*.**.nic.phy80211p.usePropagationDelay = true
-
-*.**.nic.phy80211p.antenna = xmldoc("antenna.xml", "/root/Antenna[@id='monopole']")
-*.node[*].nic.phy80211p.antennaOffsetY = 0 m
-*.node[*].nic.phy80211p.antennaOffsetZ = 1.895 m
-
-##########################################################
-#                      App Layer                         #
-##########################################################
-*.node[*].applType = "TraCIDemo11p"
-*.node[*].appl.headerLength = 80 bit
-*.node[*].appl.sendBeacons = false
-*.node[*].appl.dataOnSch = false
-*.node[*].appl.beaconInterval = 1s
-
-##########################################################
-#                      Mobility                          #
-##########################################################
-*.node[*].veinsmobility.x = 0
-*.node[*].veinsmobility.y = 0
-*.node[*].veinsmobility.z = 0
-*.node[*].veinsmobility.setHostSpeed = false
-*.node[*0].veinsmobility.accidentCount = 1
-*.node[*0].veinsmobility.accidentStart = 73s
-*.node[*0].veinsmobility.accidentDuration = 50s
-
-[Config Default]
-
-[Config WithBeaconing]
-*.rsu[*].appl.sendBeacons = true
-*.node[*].appl.sendBeacons = true
-
-[Config WithChannelSwitching]
-*.**.nic.mac1609_4.useServiceChannel = true
-*.node[*].appl.dataOnSch = true
-*.rsu[*].appl.dataOnSch = true
-
-"""
         name = f"{filename}_Clean.omnetpp.ini"
-        with open(name, 'w') as f: f.write(content)
+        content = CLEAN_OMNETPP_INI_TEMPLATE.substitute(
+            filename=filename, type=type, end_time=end_time, pg_x=pg_x, pg_y=pg_y, rsu_x=rsu_x, rsu_y=rsu_y)
+        Path(name).write_text(content)
         self.log(f"Created {name}")
         return name  
     def cleanup(self, filename):
@@ -779,12 +850,24 @@ class SumoApp(QMainWindow):
         self.log_view.setReadOnly(True)
         self.log_view.setStyleSheet("background-color: #1e1e1e; color: #00ff00; font-family: monospace;")
         self.tabs.addTab(self.log_view, "2. Process Log")
+        # Worker lines are buffered and written to the view in batches; the
+        # single-shot timer only runs while there is something waiting
+        self._log_buf = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_log)
         self.plot_viewer = PlotViewer()
         self.tabs.addTab(self.plot_viewer, "3. Route Analysis Plot")
+        self._existing_osm_notice_shown = False
         
         layout.addWidget(self.tabs)
 
     def start_process(self):
+        # A valid local OSM file means no download, so the selected bounds are never used
+        if _osm_is_valid(f"{self.filename_edit.text().strip()}.osm"):
+            self.handle_bounds(None)
+            return
         self.map_view.page().runJavaScript("getSelectionBounds()", self.handle_bounds)
     def handle_bounds(self, bounds):
         """
@@ -793,13 +876,12 @@ class SumoApp(QMainWindow):
         """
         filename = self.filename_edit.text().strip()
         osm_file = f"{filename}.osm"
-        is_valid_file = False
-        if os.path.exists(osm_file):
-            if os.path.getsize(osm_file) > MIN_OSM_FILE_SIZE:
-                is_valid_file = True
+        is_valid_file = _osm_is_valid(osm_file)
         if not bounds:
             if is_valid_file:
-                QMessageBox.information(self, "Using Existing File", f"No area selected. Proceeding with analysis and generation using existing file: {osm_file}")
+                if not self._existing_osm_notice_shown:
+                    QMessageBox.information(self, "Using Existing File", f"Proceeding with analysis and generation using existing file: {osm_file}\nDelete it to download a newly selected area.")
+                    self._existing_osm_notice_shown = True
                 bounds = {'west': 0, 'south': 0, 'east': 0, 'north': 0} 
             else:
                 QMessageBox.warning(self, "Action Required", "Please draw a rectangle on the map to define the simulation area, or ensure a valid OSM file exists.")
@@ -822,20 +904,32 @@ class SumoApp(QMainWindow):
         self.worker.start()
 
     def update_log(self, text):
-        self.log_view.append(text)
+        self._log_buf.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_log(self):
+        self._flush_timer.stop()
+        if not self._log_buf:
+            return
         cursor = self.log_view.textCursor()
         cursor.movePosition(cursor.End)
+        if not self.log_view.document().isEmpty():
+            cursor.insertText("\n")
+        cursor.insertText("\n".join(self._log_buf))
+        self._log_buf.clear()
         self.log_view.setTextCursor(cursor)
         
-    def process_finished(self, success: bool, plot_figure: Optional[Figure]): 
+    def process_finished(self, success: bool, top_edges: Optional[List[Tuple[str, int]]]): 
+        self._flush_log()
         self.btn_generate.setEnabled(True)
         filename = self.filename_edit.text().strip()
         
         if success:
             QMessageBox.information(self, "Success", "All files generated successfully! The route analysis plot is available in the 'Route Analysis Plot' tab.")
             
-            if plot_figure:
-                self.plot_viewer.set_plot(plot_figure, filename)
+            if top_edges:
+                self.plot_viewer.set_plot(top_edges, filename)
                 self.tabs.setCurrentIndex(2)
         else:
             QMessageBox.critical(self, "Failed", "Process failed. Check the logs for details.")
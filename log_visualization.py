@@ -1,26 +1,146 @@
 import sys
 import os
-import xml.etree.ElementTree as ET
+import glob
+import hashlib
+import multiprocessing
+import re
+import zipfile
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QTabWidget, QPushButton, QLineEdit, 
     QTextEdit, QMessageBox, QHBoxLayout, QLabel, QFileDialog
 )
 from PyQt5.QtCore import QThread, pyqtSignal
+from matplotlib import cbook
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
+# --- XML Streaming ---
+def iter_records(path: str, tag: str):
+    """Yields every finished <tag> element, releasing it once the caller moves on."""
+    if HAS_LXML:
+        # lxml filters on the tag in C and lets us drop already-read siblings
+        for _, elem in ET.iterparse(path, events=('end',), tag=tag):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    context = ET.iterparse(path, events=('start', 'end'))
+    _, root = next(context)
+    for event, elem in context:
+        if event == 'end' and elem.tag == tag:
+            yield elem
+            root.clear()
+
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+def count_records(path: str, tag: str) -> int:
+    """Upper bound on the number of <tag> elements in path, from a raw byte scan."""
+    pattern = re.compile(b'<' + tag.encode() + rb'[\s/>]')
+    count, tail = 0, b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(COUNT_CHUNK_SIZE)
+            if not chunk:
+                return count
+            buf = tail + chunk
+            count += len(pattern.findall(buf))
+            # Too short to hold a whole match, so nothing is counted twice
+            tail = buf[-len(tag) - 1:]
+
+def grow_columns(*columns):
+    """Doubles the capacity of preallocated columns whose record count was underestimated."""
+    return tuple(np.concatenate([c, np.empty(max(len(c), 1024), dtype=c.dtype)]) for c in columns)
+
+# --- Parse Cache ---
+# Follows the XDG base directory spec, which treats an empty XDG_CACHE_HOME as unset
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "v2x_rsu")
+CACHE_VERSION = 1
+
+def cache_path(path: str) -> str:
+    """Cache file for the current contents of path; any edit changes its mtime/size key."""
+    st = os.stat(path)
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{key}-v{CACHE_VERSION}-{st.st_mtime_ns}-{st.st_size}.npz")
+
+def load_cache(cache_file: str, data) -> bool:
+    """Fills data's fields from cache_file, returning False if there is no usable entry."""
+    fields = [name for name in vars(data) if name != 'label']
+    try:
+        with np.load(cache_file) as z:
+            values = {name: z[name] for name in fields}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        # Missing, corrupt or foreign entries just mean the file gets parsed again
+        return False
+    for name, value in values.items():
+        setattr(data, name, value.item() if value.ndim == 0 else value)
+    return True
+
+def save_cache(cache_file: str, data):
+    """Stores every field of data except its label, replacing older entries for the same file."""
+    prefix = os.path.basename(cache_file).split('-', 1)[0]
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for stale in glob.glob(os.path.join(CACHE_DIR, f"{prefix}-*.npz")):
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, **{k: v for k, v in vars(data).items() if k != 'label'})
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except FileNotFoundError:
+            pass
+        raise
+
+# Records between progress messages while parsing, so the signal queue stays quiet
+PROGRESS_INTERVAL = 10000
+
+# --- Plot Helpers ---
+SCATTER_MAX_POINTS = 5000
+SCATTER_KEEP_TOP = 200
+
+def scatter_sample(values: np.ndarray, max_points: int = SCATTER_MAX_POINTS, keep_top: int = SCATTER_KEEP_TOP) -> np.ndarray:
+    """Indices of at most max_points values: the keep_top largest plus a fixed-seed random sample of the rest."""
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    top = np.argpartition(values, -keep_top)[-keep_top:]
+    rest = np.ones(n, dtype=bool)
+    rest[top] = False
+    sample = np.random.default_rng(0).choice(np.flatnonzero(rest), size=max_points - keep_top, replace=False)
+    return np.concatenate([top, sample])
+
+def time_loss_stats(trips) -> tuple:
+    """Mean, standard deviation and maximum of a scenario's time losses."""
+    return float(np.mean(trips.time_loss)), float(np.std(trips.time_loss)), float(np.max(trips.time_loss))
+
 # --- Data Containers ---
 class TripData:
     def __init__(self, label: str):
         self.label = label
         self.depart = []
-        self.duration = []
         self.time_loss = []
-        self.waiting_time = []
         self.route_length = []
+        # Duration and waiting time only feed averages, so just their totals are kept
+        self.duration_total = 0.0
+        self.waiting_time_total = 0.0
         self.count = 0
         self.reroutes = 0
 
@@ -31,27 +151,110 @@ class SummaryData:
         self.running_vehicles = []
         self.mean_speed = []
 
+# --- Chart Builders ---
+# Each builder draws one chart onto an empty Figure from the parsed scenario data
+def uses(*keys):
+    """Records which entries of the scenario data a chart builder reads."""
+    def mark(builder):
+        builder.inputs = keys
+        return builder
+    return mark
+
+@uses('cs', 'bs')
+def build_congestion(fig: Figure, data: dict):
+    ax = fig.add_subplot(111)
+    for label, summary, color in (("Clean", data['cs'], 'blue'), ("Blocked", data['bs'], 'red')):
+        ax.plot(summary.time, summary.running_vehicles, label=label, color=color)
+    ax.set_title("Network Congestion (Active Vehicles)"); ax.set_xlabel("Time (s)"); ax.legend()
+
+@uses('ct', 'bt')
+def build_distribution(fig: Figure, data: dict):
+    ct, bt = data['ct'], data['bt']
+    ax = fig.add_subplot(111)
+    # Shared bin edges keep the two densities directly comparable bar for bar
+    edges = np.histogram_bin_edges(np.concatenate([ct.time_loss, bt.time_loss]), bins=30)
+    for label, trips, color in (('Clean', ct, 'blue'), ('Blocked', bt, 'red')):
+        hist, _ = np.histogram(trips.time_loss, bins=edges, density=True)
+        ax.bar(edges[:-1], hist, width=np.diff(edges), align='edge', alpha=0.5, label=label, color=color)
+    ax.set_title("Time Loss Probability Density"); ax.set_xlabel("Seconds Lost"); ax.legend()
+
+@uses('ct', 'bt')
+def build_scatter(fig: Figure, data: dict):
+    ax = fig.add_subplot(111)
+    for label, trips, color, size, alpha in (("Clean", data['ct'], 'blue', 5, 0.2), ("Blocked", data['bt'], 'red', 8, 0.4)):
+        # Plot a bounded sample that always keeps the worst delays visible
+        idx = scatter_sample(trips.time_loss)
+        ax.scatter(trips.depart[idx], trips.time_loss[idx], color=color, s=size, alpha=alpha, label=label)
+    ax.set_title("Impact Timing (Departure vs Delay)"); ax.set_xlabel("Departure Time (s)"); ax.set_ylabel("Time Loss (s)"); ax.legend()
+
+@uses('ct', 'bt')
+def build_length(fig: Figure, data: dict):
+    ct, bt = data['ct'], data['bt']
+    ax = fig.add_subplot(111)
+    ax.bxp(cbook.boxplot_stats([ct.route_length, bt.route_length], labels=['Clean', 'Blocked']))
+    ax.set_title("Route Length Comparison"); ax.set_ylabel("Distance (m)")
+
+@uses('ct', 'bt', 'ct_loss', 'bt_loss')
+def build_bars(fig: Figure, data: dict):
+    ax = fig.add_subplot(111)
+    metrics = ['Duration', 'TimeLoss', 'Waiting']
+    x = np.arange(len(metrics))
+    for label, trips, loss, color, offset in (('Clean', data['ct'], data['ct_loss'], 'skyblue', -0.2),
+                                              ('Blocked', data['bt'], data['bt_loss'], 'salmon', 0.2)):
+        vals = [trips.duration_total / trips.count, loss[0], trips.waiting_time_total / trips.count]
+        ax.bar(x + offset, vals, 0.4, label=label, color=color)
+    ax.set_xticks(x); ax.set_xticklabels(metrics); ax.set_title("Average Impact per Vehicle"); ax.legend()
+
+@uses('cs', 'bs')
+def build_speed(fig: Figure, data: dict):
+    ax = fig.add_subplot(111)
+    for label, summary, color in (("Clean", data['cs'], 'blue'), ("Blocked", data['bs'], 'red')):
+        ax.plot(summary.time, summary.mean_speed, label=label, color=color, alpha=0.7)
+    ax.set_title("Network Mean Speed Over Time"); ax.set_xlabel("Time (s)"); ax.set_ylabel("Speed (m/s)"); ax.legend()
+
+FIGURE_BUILDERS = {
+    'congestion': build_congestion,
+    'distribution': build_distribution,
+    'scatter': build_scatter,
+    'length': build_length,
+    'bars': build_bars,
+    'speed': build_speed,
+}
+
+def chart_inputs(name: str, data: dict) -> dict:
+    """The entries of the scenario data that the named chart's builder declared it uses."""
+    return {key: data[key] for key in FIGURE_BUILDERS[name].inputs}
+
+def build_figure(name: str, data: dict, figsize=None) -> Figure:
+    fig = Figure(figsize=figsize)
+    FIGURE_BUILDERS[name](fig, data)
+    return fig
+
+def render_and_save(job):
+    """Rebuilds one chart on an off-screen Agg canvas and writes it as a PNG (runs in a worker process)."""
+    name, data, out_path, figsize = job
+    fig = build_figure(name, data, figsize)
+    FigureCanvasAgg(fig)
+    fig.savefig(out_path, dpi=300)
+    return out_path
+
 # --- Matplotlib Integration ---
 class PlotViewer(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
-        self.canvas = None
-        self.toolbar = None
-        self.figure = None
-
-    def set_plot(self, fig: Figure):
-        if self.canvas:
-            self.layout.removeWidget(self.toolbar)
-            self.layout.removeWidget(self.canvas)
-            self.canvas.deleteLater()
-            self.toolbar.deleteLater()
-        self.figure = fig
+        # One canvas per tab for the lifetime of the window; re-runs only redraw it
+        self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
         self.layout.addWidget(self.toolbar)
         self.layout.addWidget(self.canvas)
-        self.canvas.draw()
+
+    def set_plot(self, builder, data: dict):
+        self.figure.clf()
+        builder(self.figure, data)
+        self.toolbar.update()
+        self.canvas.draw_idle()
 
 # --- Worker Thread ---
 class AnalysisWorker(QThread):
@@ -65,29 +268,72 @@ class AnalysisWorker(QThread):
 
     def parse_trip(self, path, label) -> TripData:
         data = TripData(label)
-        tree = ET.parse(path)
-        root = tree.getroot()
-        trips = root.findall('tripinfo')
-        data.count = len(trips)
-        for t in trips:
-            data.depart.append(float(t.get('depart')))
-            data.duration.append(float(t.get('duration')))
-            data.time_loss.append(float(t.get('timeLoss')))
-            data.waiting_time.append(float(t.get('waitingTime')))
-            data.route_length.append(float(t.get('routeLength')))
-            if int(t.get('rerouteNo', 0)) > 0:
+        cache_file = cache_path(path)
+        if load_cache(cache_file, data):
+            self.log_signal.emit(f"⚡ Using cached data for {os.path.basename(path)}")
+            return data
+        # Sized up front from a byte scan, so records go straight into float32 storage
+        n = count_records(path, 'tripinfo')
+        depart = np.empty(n, dtype=np.float32)
+        time_loss = np.empty(n, dtype=np.float32)
+        route_length = np.empty(n, dtype=np.float32)
+        i = -1
+        for i, t in enumerate(iter_records(path, 'tripinfo')):
+            # Non-UTF-8 logs can defeat the byte scan, so never trust its count blindly
+            if i == len(depart):
+                depart, time_loss, route_length = grow_columns(depart, time_loss, route_length)
+            depart[i] = float(t.get('depart'))
+            data.duration_total += float(t.get('duration'))
+            time_loss[i] = float(t.get('timeLoss'))
+            data.waiting_time_total += float(t.get('waitingTime'))
+            route_length[i] = float(t.get('routeLength'))
+            # SUMO writes plain integers, so a string test avoids an int() per trip
+            reroute_no = t.get('rerouteNo')
+            if reroute_no is not None and reroute_no != '0':
                 data.reroutes += 1
+            if (i + 1) % PROGRESS_INTERVAL == 0:
+                self.log_signal.emit(f"⏳ {os.path.basename(path)}: {i + 1} trips read")
+        data.count = i + 1
+        # The scan may also have matched tags inside comments, or grown the columns past the end
+        data.depart = depart[:data.count]
+        data.time_loss = time_loss[:data.count]
+        data.route_length = route_length[:data.count]
+        self.store_cache(cache_file, data)
         return data
 
     def parse_sum(self, path, label) -> SummaryData:
         data = SummaryData(label)
-        tree = ET.parse(path)
-        for s in tree.getroot().findall('step'):
-            data.time.append(float(s.get('time')))
-            data.running_vehicles.append(int(s.get('running')))
-            data.mean_speed.append(float(s.get('meanSpeed')))
+        cache_file = cache_path(path)
+        if load_cache(cache_file, data):
+            self.log_signal.emit(f"⚡ Using cached data for {os.path.basename(path)}")
+            return data
+        n = count_records(path, 'step')
+        time = np.empty(n, dtype=np.float32)
+        running_vehicles = np.empty(n, dtype=np.int32)
+        mean_speed = np.empty(n, dtype=np.float32)
+        i = -1
+        for i, s in enumerate(iter_records(path, 'step')):
+            if i == len(time):
+                time, running_vehicles, mean_speed = grow_columns(time, running_vehicles, mean_speed)
+            time[i] = float(s.get('time'))
+            running_vehicles[i] = int(s.get('running'))
+            mean_speed[i] = float(s.get('meanSpeed'))
+            if (i + 1) % PROGRESS_INTERVAL == 0:
+                self.log_signal.emit(f"⏳ {os.path.basename(path)}: {i + 1} steps read")
+        count = i + 1
+        data.time = time[:count]
+        data.running_vehicles = running_vehicles[:count]
+        data.mean_speed = mean_speed[:count]
+        self.store_cache(cache_file, data)
         return data
 
+    def store_cache(self, cache_file, data):
+        # A read-only or full home directory only costs the speed-up, never the analysis
+        try:
+            save_cache(cache_file, data)
+        except OSError as e:
+            self.log_signal.emit(f"⚠️ Could not cache parsed data: {e}")
+
     def run(self):
         try:
             b, f = self.base_name, self.folder_path
@@ -99,49 +345,19 @@ class AnalysisWorker(QThread):
             }
 
             self.log_signal.emit(f"📊 Analyzing files for scenario: {b}")
-            ct, bt = self.parse_trip(paths['c_t'], "Clean"), self.parse_trip(paths['b_t'], "Blocked")
-            cs, bs = self.parse_sum(paths['c_s'], "Clean"), self.parse_sum(paths['b_s'], "Blocked")
-
-            figs = {}
-
-            # 1. Congestion
-            f1 = Figure(); ax = f1.add_subplot(111)
-            ax.plot(cs.time, cs.running_vehicles, label="Clean", color='blue')
-            ax.plot(bs.time, bs.running_vehicles, label="Blocked", color='red')
-            ax.set_title("Network Congestion (Active Vehicles)"); ax.set_xlabel("Time (s)"); ax.legend(); figs['congestion'] = f1
-
-            # 2. Time Loss Distribution
-            f2 = Figure(); ax = f2.add_subplot(111)
-            ax.hist(ct.time_loss, bins=30, alpha=0.5, label='Clean', color='blue', density=True)
-            ax.hist(bt.time_loss, bins=30, alpha=0.5, label='Blocked', color='red', density=True)
-            ax.set_title("Time Loss Probability Density"); ax.set_xlabel("Seconds Lost"); ax.legend(); figs['distribution'] = f2
-
-            # 3. Time Loss Scatter
-            f3 = Figure(); ax = f3.add_subplot(111)
-            ax.scatter(ct.depart, ct.time_loss, color='blue', s=5, alpha=0.2, label="Clean")
-            ax.scatter(bt.depart, bt.time_loss, color='red', s=8, alpha=0.4, label="Blocked")
-            ax.set_title("Impact Timing (Departure vs Delay)"); ax.set_xlabel("Departure Time (s)"); ax.set_ylabel("Time Loss (s)"); ax.legend(); figs['scatter'] = f3
-
-            # 4. Route Truncation
-            f4 = Figure(); ax = f4.add_subplot(111)
-            ax.boxplot([ct.route_length, bt.route_length], labels=['Clean', 'Blocked'])
-            ax.set_title("Route Length Comparison"); ax.set_ylabel("Distance (m)"); figs['length'] = f4
-
-            # 5. Delay Averages
-            f5 = Figure(); ax = f5.add_subplot(111)
-            metrics = ['Duration', 'TimeLoss', 'Waiting']
-            c_vals = [np.mean(ct.duration), np.mean(ct.time_loss), np.mean(ct.waiting_time)]
-            b_vals = [np.mean(bt.duration), np.mean(bt.time_loss), np.mean(bt.waiting_time)]
-            x = np.arange(len(metrics))
-            ax.bar(x - 0.2, c_vals, 0.4, label='Clean', color='skyblue')
-            ax.bar(x + 0.2, b_vals, 0.4, label='Blocked', color='salmon')
-            ax.set_xticks(x); ax.set_xticklabels(metrics); ax.set_title("Average Impact per Vehicle"); ax.legend(); figs['bars'] = f5
-
-            # 6. NEW: Mean Speed Comparison Chart
-            f6 = Figure(); ax = f6.add_subplot(111)
-            ax.plot(cs.time, cs.mean_speed, label="Clean", color='blue', alpha=0.7)
-            ax.plot(bs.time, bs.mean_speed, label="Blocked", color='red', alpha=0.7)
-            ax.set_title("Network Mean Speed Over Time"); ax.set_xlabel("Time (s)"); ax.set_ylabel("Speed (m/s)"); ax.legend(); figs['speed'] = f6
+            # The four files are independent, so their disk reads can overlap
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = (executor.submit(self.parse_trip, paths['c_t'], "Clean"),
+                           executor.submit(self.parse_trip, paths['b_t'], "Blocked"),
+                           executor.submit(self.parse_sum, paths['c_s'], "Clean"),
+                           executor.submit(self.parse_sum, paths['b_s'], "Blocked"))
+                ct, bt, cs, bs = (f.result() for f in futures)
+
+            # Each time loss statistic is reduced once and shared by the charts and the report
+            c_mean, c_std, c_max = time_loss_stats(ct)
+            b_mean, b_std, b_max = time_loss_stats(bt)
+            data = {'ct': ct, 'bt': bt, 'cs': cs, 'bs': bs,
+                    'ct_loss': (c_mean, c_std, c_max), 'bt_loss': (b_mean, b_std, b_max)}
 
             # Detailed Report
             clean_mean_speed = np.mean(cs.mean_speed)
@@ -157,21 +373,38 @@ class AnalysisWorker(QThread):
                      f"\nAvg Mean Speed (Blocked):    {blocked_mean_speed:.2f} m/s"
                      f"\nSPEED REDUCTION:             -{clean_mean_speed - blocked_mean_speed:.2f} m/s"
                      f"\n\n[TIME LOSS ANALYSIS]"
-                     f"\nAvg Time Loss (Clean):       {np.mean(ct.time_loss):.1f}s"
-                     f"\nAvg Time Loss (Blocked):     {np.mean(bt.time_loss):.1f}s"
-                     f"\nATTACK IMPACT (Added Delay): +{np.mean(bt.time_loss) - np.mean(ct.time_loss):.2f}s"
+                     f"\nAvg Time Loss (Clean):       {c_mean:.1f}s"
+                     f"\nAvg Time Loss (Blocked):     {b_mean:.1f}s"
+                     f"\nATTACK IMPACT (Added Delay): +{b_mean - c_mean:.2f}s"
                      f"\n\n[EXTREME VALUES & VARIANCE]"
-                     f"\nMax Time Loss (Clean):       {np.max(ct.time_loss):.1f}s"
-                     f"\nMax Time Loss (Blocked):     {np.max(bt.time_loss):.1f}s"
-                     f"\nStd Dev Time Loss (Blocked): {np.std(bt.time_loss):.2f}"
+                     f"\nMax Time Loss (Clean):       {c_max:.1f}s"
+                     f"\nMax Time Loss (Blocked):     {b_max:.1f}s"
+                     f"\nStd Dev Time Loss (Blocked): {b_std:.2f}"
                      f"\n\n[WAITING TIME]"
-                     f"\nAvg Waiting (Clean):         {np.mean(ct.waiting_time):.1f}s"
-                     f"\nAvg Waiting (Blocked):       {np.mean(bt.waiting_time):.1f}s")
+                     f"\nAvg Waiting (Clean):         {ct.waiting_time_total / ct.count:.1f}s"
+                     f"\nAvg Waiting (Blocked):       {bt.waiting_time_total / bt.count:.1f}s")
 
-            self.finished_signal.emit(True, figs, report)
+            self.finished_signal.emit(True, data, report)
         except Exception as e:
             self.log_signal.emit(f"❌ Error: {str(e)}"); self.finished_signal.emit(False, {}, "")
 
+class ExportWorker(QThread):
+    finished_signal = pyqtSignal(bool, str)
+
+    def __init__(self, jobs: list):
+        super().__init__()
+        self.jobs = jobs
+
+    def run(self):
+        # Waiting on the render processes here keeps the GUI thread free
+        try:
+            # Forking a running, multi-threaded Qt process is unsafe, so workers start fresh
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+                list(executor.map(render_and_save, self.jobs))
+            self.finished_signal.emit(True, "")
+        except Exception as e:
+            self.finished_signal.emit(False, str(e))
+
 # --- Main UI ---
 class AdvancedVisApp(QMainWindow):
     def __init__(self):
@@ -179,6 +412,8 @@ class AdvancedVisApp(QMainWindow):
         self.setWindowTitle("V2X Attack - Research Analytics Suite")
         self.resize(1200, 900)
         self.figs = {}
+        self.figs_data = {}
+        self.export_worker = None
         
         container = QWidget(); self.setCentralWidget(container)
         main_layout = QVBoxLayout(container)
@@ -219,6 +454,17 @@ class AdvancedVisApp(QMainWindow):
         self.tabs.addTab(self.report_view, "7. Final Report")
         main_layout.addWidget(self.tabs)
 
+        # Charts are only drawn once their tab is first opened
+        self.plot_tabs = {
+            self.tabs.indexOf(self.tab_congest): 'congestion',
+            self.tabs.indexOf(self.tab_dist): 'distribution',
+            self.tabs.indexOf(self.tab_scatter): 'scatter',
+            self.tabs.indexOf(self.tab_length): 'length',
+            self.tabs.indexOf(self.tab_bars): 'bars',
+            self.tabs.indexOf(self.tab_speed): 'speed',
+        }
+        self.tabs.currentChanged.connect(self.ensure_fig)
+
     def browse_folder(self):
         path = QFileDialog.getExistingDirectory(self, "Select Parent Directory")
         if path: self.path_in.setText(path)
@@ -237,25 +483,49 @@ class AdvancedVisApp(QMainWindow):
         self.worker.finished_signal.connect(self.update_ui)
         self.worker.start()
 
-    def update_ui(self, success, figs, report):
+    def update_ui(self, success, data, report):
         if success:
-            self.figs = figs
-            self.tab_congest.set_plot(figs['congestion'])
-            self.tab_dist.set_plot(figs['distribution'])
-            self.tab_scatter.set_plot(figs['scatter'])
-            self.tab_length.set_plot(figs['length'])
-            self.tab_bars.set_plot(figs['bars'])
-            self.tab_speed.set_plot(figs['speed']) # NEW UPDATE
+            self.figs_data = data
+            self.figs = {}
             self.report_view.setText(report)
-            self.btn_save.setEnabled(True)
+            # A running export keeps the button until it finishes
+            self.btn_save.setEnabled(not self.export_running())
             self.tabs.setCurrentIndex(6)
+            # setCurrentIndex does not signal when the tab is already showing
+            self.ensure_fig(self.tabs.currentIndex())
+
+    def ensure_fig(self, index):
+        name = self.plot_tabs.get(index)
+        if name is None or not self.figs_data or name in self.figs:
+            return
+        viewer = self.tabs.widget(index)
+        viewer.set_plot(FIGURE_BUILDERS[name], self.figs_data)
+        self.figs[name] = viewer.figure
+
+    def export_running(self) -> bool:
+        return self.export_worker is not None and self.export_worker.isRunning()
 
     def save_all(self):
+        if self.export_running():
+            return
         dir_path = QFileDialog.getExistingDirectory(self, "Select Folder to Save Charts")
         if dir_path:
-            for name, fig in self.figs.items():
-                fig.savefig(os.path.join(dir_path, f"Research_{name}.png"), dpi=300)
+            # Match the on-screen chart size; every plot tab shares the same canvas area
+            figsize = tuple(next(iter(self.figs.values())).get_size_inches()) if self.figs else None
+            # 300 dpi rasterising is CPU bound, so each chart is redrawn in its own process
+            jobs = [(name, chart_inputs(name, self.figs_data), os.path.join(dir_path, f"Research_{name}.png"), figsize)
+                    for name in FIGURE_BUILDERS]
+            self.btn_save.setEnabled(False)
+            self.export_worker = ExportWorker(jobs)
+            self.export_worker.finished_signal.connect(self.export_done)
+            self.export_worker.start()
+
+    def export_done(self, success, error):
+        self.btn_save.setEnabled(True)
+        if success:
             QMessageBox.information(self, "Saved", "All charts exported.")
+        else:
+            QMessageBox.warning(self, "Export Error", f"Could not export charts:\n{error}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv); win = AdvancedVisApp(); win.show(); sys.exit(app.exec_())
\ No newline at end of file